@@ -3,7 +3,11 @@ from datetime import datetime
 import numpy as np
 import pandas as pd
 
-from torch_frame.data.stats import StatType, compute_col_stats
+from torch_frame.data.stats import (
+    StatType,
+    compute_all_col_stats,
+    compute_col_stats,
+)
 from torch_frame.datasets.fake import _random_timestamp
 from torch_frame.stype import (
     categorical,
@@ -32,6 +36,15 @@ def test_compute_col_stats_all_categorical():
     }
 
 
+def test_compute_col_stats_categorical_dtype_with_unused_categories():
+    ser = pd.Series(['a', 'b', 'a', None],
+                    dtype=pd.CategoricalDtype(['z', 'a', 'y', 'b']))
+    stype = categorical
+    assert compute_col_stats(ser, stype) == {
+        StatType.COUNT: (['a', 'b', 'z', 'y'], [2, 1, 0, 0]),
+    }
+
+
 def test_compute_col_stats_all_multi_categorical():
     for ser in [
             pd.Series(['a|a|b', 'a|c', 'c|a', 'a|b|c', '', None]),
@@ -82,6 +95,14 @@ def test_compute_col_stats_all_timestamp():
     assert (year_range[0] == year_range[1] == 1900)
 
 
+def test_compute_col_stats_timestamp_with_datetime_dtype():
+    ser = pd.Series(pd.to_datetime(['2001-03-04', None, '1999-12-31']))
+    stype = timestamp
+    assert compute_col_stats(ser, stype) == {
+        StatType.YEAR_RANGE: [1999, 2001],
+    }
+
+
 def test_compute_col_stats_all_timestamp_with_all_nan():
     ser = pd.Series([np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan])
     stype = timestamp
@@ -152,3 +173,56 @@ def test_compute_col_stats_numerical_all_nan():
         StatType.STD: np.nan,
         StatType.QUANTILES: [np.nan, np.nan, np.nan, np.nan, np.nan],
     }
+
+
+def test_compute_col_stats_numerical_nullable_dtype():
+    ser = pd.Series([1, 2, 3, None], dtype='Int64')
+    stype = numerical
+    assert compute_col_stats(ser, stype) == {
+        StatType.MEAN: 2.0,
+        StatType.STD: 0.816496580927726,
+        StatType.QUANTILES: [1.0, 1.5, 2.0, 2.5, 3.0],
+    }
+
+
+def test_compute_col_stats_numerical_quantiles_match_numpy():
+    rng = np.random.default_rng(42)
+    for num_rows in [1, 2, 5, 101, 1000]:
+        ser = pd.Series(rng.standard_normal(num_rows))
+        stats = compute_col_stats(ser, numerical)
+        expected = np.quantile(ser.values, q=[0, 0.25, 0.5, 0.75, 1])
+        assert stats[StatType.QUANTILES] == expected.tolist()
+
+
+def test_compute_all_col_stats():
+    df = pd.DataFrame({
+        'num': [1, 2, 3, np.nan],
+        'cat': ['a', 'b', 'a', None],
+        'multicat': ['a|b', 'b', 'a|c', None],
+        'seq': [[1, 2], [3], [4, 5, 6], [np.nan]],
+    })
+    col_to_stype = {
+        'num': numerical,
+        'cat': categorical,
+        'multicat': multicategorical,
+        'seq': sequence_numerical,
+    }
+    col_to_sep = {'multicat': '|'}
+    expected = {
+        col: compute_col_stats(df[col], stype, sep=col_to_sep.get(col))
+        for col, stype in col_to_stype.items()
+    }
+    for num_workers in [None, 1, 2]:
+        col_stats = compute_all_col_stats(df, col_to_stype,
+                                          col_to_sep=col_to_sep,
+                                          num_workers=num_workers)
+        assert list(col_stats.keys()) == list(col_to_stype.keys())
+        assert col_stats == expected
+
+
+def test_compute_col_stats_numerical_float32_precision():
+    rng = np.random.default_rng(0)
+    arr = (rng.standard_normal(1_000_000) * 50 + 100).astype(np.float32)
+    stats = compute_col_stats(pd.Series(arr), numerical)
+    assert stats[StatType.MEAN] == np.mean(arr).item()
+    assert stats[StatType.STD] == np.std(arr).item()
@@ -1,3 +1,5 @@
+import numpy as np
+import pandas as pd
 import pytest
 
 from torch_frame import Metric, TaskType, stype
@@ -56,3 +58,33 @@ def test_gbdt(gbdt_cls, task_type_and_metric):
         assert (0 <= score <= 1)
     elif task_type == TaskType.MULTICLASS_CLASSIFICATION:
         assert (0 <= score <= 1)
+
+
+@pytest.mark.parametrize('stypes', [
+    [stype.numerical],
+    [stype.categorical],
+    [stype.numerical, stype.categorical, stype.text_embedded],
+])
+def test_catboost_input(stypes):
+    dataset: Dataset = FakeDataset(
+        num_rows=10,
+        stypes=stypes,
+        task_type=TaskType.REGRESSION,
+        text_embedder_cfg=TextEmbedderConfig(
+            text_embedder=HashTextEmbedder(8)),
+    )
+    dataset.materialize()
+    tf = dataset.tensor_frame
+    gbdt = CatBoost(task_type=TaskType.REGRESSION, metric=Metric.RMSE)
+    x, y, cat_features = gbdt._to_catboost_input(tf)
+    assert x.shape[0] == y.shape[0] == len(tf)
+    num_cat_cols = len(tf.col_names_dict.get(stype.categorical, []))
+    assert cat_features.tolist() == list(range(num_cat_cols))
+    if len(stypes) == 1:
+        # No `DataFrame` is needed for a single kind of features:
+        assert isinstance(x, np.ndarray)
+    else:
+        assert isinstance(x, pd.DataFrame)
+        assert x.columns.tolist() == list(range(x.shape[1]))
+        assert (x.dtypes[:num_cat_cols] == np.int64).all()
+        assert (x.dtypes[num_cat_cols:] == np.float32).all()
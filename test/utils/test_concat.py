@@ -1,3 +1,7 @@
+import copy
+
+import pytest
+
 import torch_frame
 from torch_frame import TensorFrame
 
@@ -13,6 +17,17 @@ def test_cat_tensor_frames_along_row(get_fake_tensor_frame):
         assert tf_mini == tf
 
 
+def test_cat_tensor_frames_along_row_with_mismatched_cols(
+        get_fake_tensor_frame):
+    tf = get_fake_tensor_frame(num_rows=10)
+    tf_other = copy.copy(tf)
+    stype = list(tf.col_names_dict.keys())[0]
+    tf_other.col_names_dict[stype] = list(reversed(tf.col_names_dict[stype]))
+    torch_frame.cat([tf, tf[:5]], along='row')
+    with pytest.raises(RuntimeError, match="col_names_dict's"):
+        torch_frame.cat([tf, tf_other], along='row')
+
+
 def test_cat_tensor_frames_along_col(get_fake_tensor_frame):
     num_rows = 10
     tf = get_fake_tensor_frame(num_rows=num_rows)
@@ -43,3 +58,10 @@ def test_cat_tensor_frames_along_col(get_fake_tensor_frame):
     tf2 = TensorFrame(feat_dict2, col_names_dict2, None)
     tf_cat = torch_frame.cat([tf1, tf2], along='col')
     assert tf_cat == tf
+
+
+def test_cat_tensor_frames_along_col_with_duplicates(get_fake_tensor_frame):
+    tf = get_fake_tensor_frame(num_rows=10)
+    with pytest.raises(RuntimeError, match="duplicated column names"):
+        torch_frame.cat([tf, TensorFrame(tf.feat_dict, tf.col_names_dict)],
+                        along='col')
@@ -25,7 +25,7 @@ from torch_frame.data.mapper import (
 )
 from torch_frame.data.multi_embedding_tensor import MultiEmbeddingTensor
 from torch_frame.data.multi_nested_tensor import MultiNestedTensor
-from torch_frame.data.stats import StatType, compute_col_stats
+from torch_frame.data.stats import StatType, compute_all_col_stats
 from torch_frame.typing import (
     ColumnSelectType,
     DataFrame,
@@ -475,23 +475,23 @@ class Dataset(ABC):
             return self
 
         # 1. Fill column statistics:
-        for col, stype in self.col_to_stype.items():
-            ser = self.df[col]
-            self._col_stats[col] = compute_col_stats(
-                ser,
-                stype,
-                sep=self.col_to_sep.get(col, None),
-                time_format=self.col_to_time_format.get(col, None),
-            )
-            # For a target column, sort categories lexicographically such that
-            # we do not accidentally swap labels in binary classification
-            # tasks.
-            if col == self.target_col and stype == torch_frame.categorical:
-                index, value = self._col_stats[col][StatType.COUNT]
-                if len(index) == 2:
-                    ser = pd.Series(index=index, data=value).sort_index()
-                    index, value = ser.index.tolist(), ser.values.tolist()
-                    self._col_stats[col][StatType.COUNT] = (index, value)
+        self._col_stats.update(
+            compute_all_col_stats(
+                self.df,
+                self.col_to_stype,
+                col_to_sep=self.col_to_sep,
+                col_to_time_format=self.col_to_time_format,
+            ))
+        # For a target column, sort categories lexicographically such that we
+        # do not accidentally swap labels in binary classification tasks.
+        col = self.target_col
+        if (col is not None
+                and self.col_to_stype.get(col) == torch_frame.categorical):
+            index, value = self._col_stats[col][StatType.COUNT]
+            if len(index) == 2:
+                ser = pd.Series(index=index, data=value).sort_index()
+                index, value = ser.index.tolist(), ser.values.tolist()
+                self._col_stats[col][StatType.COUNT] = (index, value)
 
         # 2. Create the `TensorFrame`:
         self._to_tensor_frame_converter = self._get_tensorframe_converter()
@@ -1,3 +1,7 @@
+import itertools
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
@@ -6,7 +10,7 @@ import pandas as pd
 
 import torch_frame
 from torch_frame.data.mapper import MultiCategoricalTensorMapper
-from torch_frame.typing import Series
+from torch_frame.typing import DataFrame, Series
 
 
 class StatType(Enum):
@@ -69,47 +73,41 @@ class StatType(Enum):
         sep: Optional[str] = None,
         time_format: Optional[str] = None,
     ) -> Any:
-        if self == StatType.MEAN:
-            flattened = np.hstack(np.hstack(ser.values))
-            finite_mask = np.isfinite(flattened)
-            if not finite_mask.any():
-                # NOTE: We may just error out here if eveything is NaN
-                return np.nan
-            return np.mean(flattened[finite_mask]).item()
-
-        elif self == StatType.STD:
-            flattened = np.hstack(np.hstack(ser.values))
-            finite_mask = np.isfinite(flattened)
-            if not finite_mask.any():
-                return np.nan
-            return np.std(flattened[finite_mask]).item()
-
-        elif self == StatType.QUANTILES:
-            flattened = np.hstack(np.hstack(ser.values))
-            finite_mask = np.isfinite(flattened)
-            if not finite_mask.any():
-                return [np.nan, np.nan, np.nan, np.nan, np.nan]
-            return np.quantile(
-                flattened[finite_mask],
-                q=[0, 0.25, 0.5, 0.75, 1],
-            ).tolist()
+        if self in (StatType.MEAN, StatType.STD, StatType.QUANTILES):
+            return _compute_numerical_stats(_finite_flat(ser))[self]
 
         elif self == StatType.COUNT:
-            count = ser.value_counts(ascending=False)
-            return count.index.tolist(), count.values.tolist()
+            if isinstance(ser.dtype, pd.CategoricalDtype):
+                # Re-use the existing codes and keep unobserved categories
+                # with a count of zero:
+                codes = ser.cat.codes.to_numpy()
+                uniques = ser.cat.categories
+            else:
+                # Hash the values only once and count the resulting codes:
+                codes, uniques = pd.factorize(ser, sort=False)
+            count = np.bincount(codes, minlength=len(uniques))
+            order = np.argsort(-count, kind='stable')
+            return uniques[order].tolist(), count[order].tolist()
 
         elif self == StatType.MULTI_COUNT:
             assert sep is not None
-            ser = ser.apply(lambda row: MultiCategoricalTensorMapper.
-                            split_by_sep(row, sep))
-            ser = ser.explode().dropna()
-            count = ser.value_counts(ascending=False)
-            return count.index.tolist(), count.values.tolist()
+            # Count categories in a single pass over the raw values instead
+            # of going through `apply`, `explode` and `value_counts`:
+            counter: Counter = Counter()
+            for row in ser.values:
+                counter.update(
+                    MultiCategoricalTensorMapper.split_by_sep(row, sep))
+            if len(counter) == 0:
+                return [], []
+            index, count = zip(*counter.most_common())
+            return list(index), list(count)
 
         elif self == StatType.YEAR_RANGE:
-            ser = pd.to_datetime(ser, format=time_format)
-            year_range = ser.dt.year.values
-            return [min(year_range), max(year_range)]
+            if not pd.api.types.is_datetime64_any_dtype(ser):
+                ser = pd.to_datetime(ser, format=time_format, cache=True)
+            # Years are monotonic in time, so we only need to extract the
+            # years of the earliest and the latest timestamp:
+            return [ser.min().year, ser.max().year]
 
 
 _default_values = {
@@ -123,12 +121,91 @@ _default_values = {
 }
 
 
+def _finite(arr: np.ndarray) -> np.ndarray:
+    r"""Drops all non-finite values of a 1-D array :obj:`arr`."""
+    finite_mask = np.isfinite(arr)
+    return arr if finite_mask.all() else arr[finite_mask]
+
+
+def _finite_flat(ser: Series) -> np.ndarray:
+    r"""Flattens a numerical or sequence numerical :obj:`ser` into a single
+    1-D array and drops all non-finite values.
+    """
+    arr = ser.to_numpy()
+    if arr.dtype == object:
+        # Sequence numerical columns hold one list of values per row, while
+        # nullable extension types hold scalar objects:
+        arr = np.hstack(arr.tolist())
+    return _finite(arr)
+
+
+def _flatten_sequences(rows: List[Any]) -> np.ndarray:
+    r"""Flattens the rows of a sequence numerical column into a single 1-D
+    array.
+    """
+    if len(rows) > 0 and isinstance(rows[0], np.ndarray):
+        return np.concatenate(rows)
+    # Stream Python lists directly into a pre-sized array instead of creating
+    # an intermediate array per row:
+    return np.fromiter(itertools.chain.from_iterable(rows), dtype=np.float64,
+                       count=sum(map(len, rows)))
+
+
+def _quantiles(arr: np.ndarray, q: List[float]) -> np.ndarray:
+    r"""Computes the quantiles :obj:`q` of a flat array of finite values via
+    partial selection (:meth:`numpy.partition`) rather than a full sort.
+    Matches the default linear interpolation of :meth:`numpy.quantile`.
+    """
+    pos = np.asarray(q, dtype=np.float64) * (arr.size - 1)
+    lower = np.floor(pos).astype(np.int64)
+    upper = np.minimum(lower + 1, arr.size - 1)
+    part = np.partition(arr, np.union1d(lower, upper))
+
+    a, b, t = part[lower], part[upper], pos - lower
+    if arr.dtype.kind != 'f':
+        a, b = a.astype(np.float64), b.astype(np.float64)
+    # Same interpolation formula as numpy to obtain identical results:
+    diff = b - a
+    return np.where(t >= 0.5, b - diff * (1 - t), a + diff * t)
+
+
+def _compute_numerical_stats(arr: np.ndarray) -> Dict[StatType, Any]:
+    r"""Computes :obj:`StatType.MEAN`, :obj:`StatType.STD` and
+    :obj:`StatType.QUANTILES` together from a flat array of finite values.
+    """
+    if arr.size == 0:
+        # NOTE: We may just error out here if eveything is NaN
+        return {
+            stat_type: _default_values[stat_type]
+            for stat_type in [StatType.MEAN, StatType.STD, StatType.QUANTILES]
+        }
+
+    mean = arr.mean()
+    # Re-use the mean for the variance instead of reducing twice inside
+    # `np.std`. We deliberately avoid the `E[x^2] - E[x]^2` shortcut since it
+    # is numerically unstable, and use numpy's pairwise summation rather than
+    # a BLAS dot product to keep the precision of `np.std` for `float32`:
+    std = np.sqrt(np.mean(np.square(arr - mean)))
+    quantiles = _quantiles(arr, q=[0, 0.25, 0.5, 0.75, 1])
+    return {
+        StatType.MEAN: mean.item(),
+        StatType.STD: std.item(),
+        StatType.QUANTILES: quantiles.tolist(),
+    }
+
+
 def compute_col_stats(
     ser: Series,
     stype: torch_frame.stype,
     sep: Optional[str] = None,
     time_format: Optional[str] = None,
 ) -> Dict[StatType, Any]:
+    if (stype == torch_frame.numerical and isinstance(ser.dtype, np.dtype)
+            and ser.dtype.kind in 'iuf'):
+        # Fast path for plain numeric columns: A single `isfinite` pass
+        # replaces masking infinite values and dropping missing ones.
+        return _compute_numerical_stats(_finite_flat(ser))
+
     if stype == torch_frame.numerical:
         ser = ser.mask(ser.isin([np.inf, -np.inf]), np.nan)
 
@@ -138,6 +215,12 @@ def compute_col_stats(
             stat_type: _default_values[stat_type]
             for stat_type in StatType.stats_for_stype(stype)
         }
+    elif stype == torch_frame.numerical:
+        # Flatten and filter the column only once for all numerical stats:
+        stats = _compute_numerical_stats(_finite_flat(ser.dropna()))
+    elif stype == torch_frame.sequence_numerical:
+        arr = _flatten_sequences(ser.dropna().tolist())
+        stats = _compute_numerical_stats(_finite(arr))
     else:
         stats = {
             stat_type: stat_type.compute(ser.dropna(), sep, time_format)
@@ -145,3 +228,56 @@ def compute_col_stats(
         }
 
     return stats
+
+
+def compute_all_col_stats(
+    df: DataFrame,
+    col_to_stype: Dict[str, torch_frame.stype],
+    col_to_sep: Optional[Dict[str, Optional[str]]] = None,
+    col_to_time_format: Optional[Dict[str, Optional[str]]] = None,
+    num_workers: Optional[int] = None,
+) -> Dict[str, Dict[StatType, Any]]:
+    r"""Computes the statistics of all columns in :obj:`col_to_stype` in
+    parallel via a thread pool. Columns are submitted as individual tasks so
+    that cheap columns do not wait for expensive ones. Most of the work
+    happens inside :obj:`numpy` and :obj:`pandas` kernels which release the
+    GIL.
+
+    Args:
+        df (DataFrame): The input data frame.
+        col_to_stype (Dict[str, torch_frame.stype]): A dictionary that maps
+            each column to its semantic type.
+        col_to_sep (Dict[str, Optional[str]], optional): A dictionary that
+            maps each multicategorical column to its separator.
+            (default: :obj:`None`)
+        col_to_time_format (Dict[str, Optional[str]], optional): A dictionary
+            that maps each timestamp column to its time format.
+            (default: :obj:`None`)
+        num_workers (int, optional): The number of worker threads. If set to
+            :obj:`None`, will use the number of CPUs. (default: :obj:`None`)
+
+    Returns:
+        Dict[str, Dict[StatType, Any]]: The statistics of each column.
+    """
+    col_to_sep = col_to_sep or {}
+    col_to_time_format = col_to_time_format or {}
+    num_workers = min(num_workers or os.cpu_count() or 1,
+                      max(len(col_to_stype), 1))
+
+    def compute(col: str) -> Dict[StatType, Any]:
+        return compute_col_stats(
+            df[col],
+            col_to_stype[col],
+            sep=col_to_sep.get(col, None),
+            time_format=col_to_time_format.get(col, None),
+        )
+
+    if num_workers <= 1:
+        return {col: compute(col) for col in col_to_stype.keys()}
+
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        futures = {
+            col: executor.submit(compute, col)
+            for col in col_to_stype.keys()
+        }
+        return {col: future.result() for col, future in futures.items()}
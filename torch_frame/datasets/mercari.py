@@ -49,18 +49,26 @@ class Mercari(torch_frame.data.Dataset):
             'shipping': torch_frame.categorical,
             'item_description': torch_frame.text_embedded,
         }
-        train_path = osp.join(self.base_url, 'train.csv')
-        self.download_url(train_path, root)
-        df_train = pd.read_csv(train_path)
-        test_path = osp.join(self.base_url, 'test_stg2.csv')
-        self.download_url(test_path, root)
-        df_test = pd.read_csv(test_path)
-        df_train[SPLIT_COL] = SPLIT_TO_NUM['train']
-        df_test[SPLIT_COL] = SPLIT_TO_NUM['test']
-        df = pd.concat([df_train, df_test], axis=0, ignore_index=True)
+        # Only parse the columns we need with the multi-threaded pyarrow
+        # engine. Note that `test_stg2.csv` does not contain the target:
+        train_cols = list(col_to_stype.keys())
+        test_cols = [col for col in train_cols if col != 'price']
+        train_path = self.download_url(
+            osp.join(self.base_url, 'train.csv'), root)
+        df = pd.read_csv(train_path, engine='pyarrow', usecols=train_cols)
+        df[SPLIT_COL] = SPLIT_TO_NUM['train']
+        if num_rows is None or num_rows > len(df):
+            # Skip downloading and parsing the test set if the requested
+            # number of rows is already covered by the training set:
+            test_path = self.download_url(
+                osp.join(self.base_url, 'test_stg2.csv'), root)
+            df_test = pd.read_csv(test_path, engine='pyarrow',
+                                  usecols=test_cols)
+            df_test[SPLIT_COL] = SPLIT_TO_NUM['test']
+            df = pd.concat([df, df_test], axis=0, ignore_index=True,
+                           copy=False)
         if num_rows is not None:
             df = df.head(num_rows)
-        df.drop(['train_id'], axis=1, inplace=True)
         super().__init__(df, col_to_stype, target_col='price', col_to_sep="/",
                          text_embedder_cfg=text_embedder_cfg,
                          split_col=SPLIT_COL)
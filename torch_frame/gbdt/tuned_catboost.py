@@ -1,4 +1,4 @@
-from typing import Any, List, Optional, Tuple
+from typing import Any, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -19,7 +19,7 @@ class CatBoost(GBDT):
     def _to_catboost_input(
         self,
         tf,
-    ) -> Tuple[DataFrame, np.ndarray, Optional[np.ndarray]]:
+    ) -> Tuple[Union[DataFrame, np.ndarray], np.ndarray, np.ndarray]:
         r"""Convert :class:`TensorFrame` into CatBoost-compatible input format:
         :obj:`(x, y, cat_features)`.
 
@@ -27,61 +27,75 @@ class CatBoost(GBDT):
             tf (Tensor Frame): Input :obj:TensorFrame object.
 
         Returns:
-            x (DataFrame): Output :obj:`Dataframe` by
-                concatenating tensors of categorical and numerical features of
-                the input :class:`TensorFrame`.
+            x (DataFrame or numpy.ndarray): Output features of the input
+                :class:`TensorFrame`, with the categorical features first.
+                This is a plain :obj:`numpy.ndarray` unless both categorical
+                and non-categorical features are present, in which case a
+                :obj:`DataFrame` is needed to keep categorical features as
+                integers.
             y (numpy.ndarray): Prediction target :obj:`numpy.ndarray`.
-            cat_features (numpy.ndarray, optional): Array containing indexes of
+            cat_features (numpy.ndarray): Array containing indexes of
                 categorical features :obj:`numpy.ndarray`.
         """
-        tf = tf.cpu()
+        if tf.device.type != 'cpu':
+            tf = tf.cpu()
         y = tf.y
         assert y is not None
 
-        dfs: List[DataFrame] = []
-        cat_features: List[np.ndarray] = []
-        offset: int = 0
-
+        cat_feat: Optional[np.ndarray] = None
         if stype.categorical in tf.feat_dict:
-            feat = tf.feat_dict[stype.categorical].numpy()
-            arange = np.arange(offset, offset + feat.shape[1])
-            dfs.append(pd.DataFrame(feat, columns=arange))
-            cat_features.append(arange)
-            offset += feat.shape[1]
+            cat_feat = tf.feat_dict[stype.categorical].numpy()
+
+        # CatBoost requires categorical features to be integers, but all the
+        # remaining features can be gathered into a single float matrix.
+        # CatBoost bins these features internally, so `float32` precision is
+        # sufficient:
+        feats: List[Tensor] = []
 
         if stype.numerical in tf.feat_dict:
-            feat = tf.feat_dict[stype.numerical].numpy()
-            arange = np.arange(offset, offset + feat.shape[1])
-            dfs.append(pd.DataFrame(feat, columns=arange))
-            offset += feat.shape[1]
+            feats.append(tf.feat_dict[stype.numerical].to(torch.float32))
 
         if stype.text_embedded in tf.feat_dict:
-            feat = tf.feat_dict[stype.text_embedded]
-            feat = feat.view(feat.size(0), -1).numpy()
-            arange = np.arange(offset, offset + feat.shape[1])
-            dfs.append(pd.DataFrame(feat, columns=arange))
-            offset += feat.shape[1]
+            feat = tf.feat_dict[stype.text_embedded].to(torch.float32)
+            feats.append(feat.view(feat.size(0), -1))
 
         # TODO Add support for other stypes.
 
-        if len(dfs) == 0:
+        feat: Optional[np.ndarray] = None
+        if len(feats) > 0:
+            feat = feats[0] if len(feats) == 1 else torch.cat(feats, dim=1)
+            feat = feat.numpy()
+
+        if cat_feat is None and feat is None:
             raise ValueError("The input TensorFrame object is empty.")
 
-        df = pd.concat(dfs, axis=1)
-        cat_features = np.concatenate(cat_features, axis=0)
-        return df, y.numpy(), cat_features
+        if cat_feat is None:
+            return feat, y.numpy(), np.arange(0)
+
+        cat_features = np.arange(cat_feat.shape[1])
+        if feat is None:
+            return cat_feat, y.numpy(), cat_features
+
+        # Mixing integer and float columns requires a `DataFrame`. Both blocks
+        # share the same index, so we can concatenate them without copying:
+        offset = cat_feat.shape[1]
+        x = pd.concat([
+            pd.DataFrame(cat_feat, columns=cat_features),
+            pd.DataFrame(feat, columns=np.arange(offset,
+                                                 offset + feat.shape[1])),
+        ], axis=1, copy=False)
+        return x, y.numpy(), cat_features
 
     def _predict_helper(
         self,
         model: Any,  # catboost.CatBoost
-        x: DataFrame,
+        x: Any,  # DataFrame or catboost.Pool
     ) -> np.ndarray:
-        r"""A helper function that applies the catboost model on DataFrame
-        :obj:`x`.
+        r"""A helper function that applies the catboost model on :obj:`x`.
 
         Args:
             model (catboost.CatBoost): The catboost model.
-            x (DataFrame): The input`DataFrame.
+            x (DataFrame or catboost.Pool): The input data.
 
         Returns:
             pred (np.nparray): The prediction output.
@@ -106,17 +120,17 @@ class CatBoost(GBDT):
 
     def objective(
         self,
-        trial,
-        tf_train: TensorFrame,
-        tf_val: TensorFrame,
+        trial: Any,  # optuna.trial.Trial
+        train_pool: Any,  # catboost.Pool
+        eval_pool: Any,  # catboost.Pool
         num_boost_round: int,
-    ):
+    ) -> float:
         r"""Objective function to be optimized.
 
         Args:
             trial (optuna.trial.Trial): Optuna trial object.
-            tf_train (TensorFrame): Train data.
-            tf_val (TensorFrame): Validation data.
+            train_pool (catboost.Pool): Train data.
+            eval_pool (catboost.Pool): Validation data.
             num_boost_round (int): Number of boosting round.
 
         Returns:
@@ -160,19 +174,16 @@ class CatBoost(GBDT):
             self.params["objective"] = "MultiClass"
             self.params["eval_metric"] = "Accuracy"
             self.params["classes_count"] = self._num_classes or len(
-                np.unique(tf_train.y.cpu().numpy()))
+                np.unique(train_pool.get_label()))
         else:
             raise ValueError(f"{self.__class__.__name__} is not supported for "
                              f"{self.task_type}.")
 
-        train_x, train_y, cat_features = self._to_catboost_input(tf_train)
-        eval_x, eval_y, _ = self._to_catboost_input(tf_val)
         boost = catboost.CatBoost(self.params)
-        boost = boost.fit(train_x, train_y, cat_features=cat_features,
-                          eval_set=[(eval_x, eval_y)],
+        boost = boost.fit(train_pool, eval_set=eval_pool,
                           early_stopping_rounds=50, logging_level="Silent")
-        pred = self._predict_helper(boost, eval_x)
-        score = self.compute_metric(torch.from_numpy(eval_y),
+        pred = self._predict_helper(boost, eval_pool)
+        score = self.compute_metric(torch.from_numpy(eval_pool.get_label()),
                                     torch.from_numpy(pred))
         return score
 
@@ -190,16 +201,21 @@ class CatBoost(GBDT):
             study = optuna.create_study(direction="minimize")
         else:
             study = optuna.create_study(direction="maximize")
+        train_x, train_y, cat_features = self._to_catboost_input(tf_train)
+        eval_x, eval_y, _ = self._to_catboost_input(tf_val)
+        train_pool = catboost.Pool(train_x, train_y, cat_features=cat_features)
+        eval_pool = catboost.Pool(eval_x, eval_y, cat_features=cat_features)
+        # Quantize the numerical features once instead of in every trial. No
+        # border-related parameters are tuned, so the result can be shared:
+        train_pool.quantize()
         study.optimize(
-            lambda trial: self.objective(trial, tf_train, tf_val,
+            lambda trial: self.objective(trial, train_pool, eval_pool,
                                          num_boost_round), num_trials)
         self.params.update(study.best_params)
-        train_x, train_y, cat_features = self._to_catboost_input(tf_train)
-        eval_x, eval_y, _ = self._to_catboost_input(tf_val)
+
         self.model = catboost.CatBoost(self.params)
-        self.model.fit(train_x, train_y, cat_features=cat_features,
-                       eval_set=[(eval_x, eval_y)], early_stopping_rounds=50,
-                       logging_level="Silent")
+        self.model.fit(train_pool, eval_set=eval_pool,
+                       early_stopping_rounds=50, logging_level="Silent")
 
     def _predict(self, tf_test: TensorFrame) -> Tensor:
         device = tf_test.device
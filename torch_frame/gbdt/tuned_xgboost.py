@@ -53,7 +53,8 @@ class XGBoost(GBDT):
                 <https://github.com/dmlc/xgboost/blob/master/doc/
                 tutorials/categorical.rst#using-native-interface>
         """
-        tf = tf.cpu()
+        if tf.device.type != 'cpu':
+            tf = tf.cpu()
         y = tf.y
         assert y is not None
 
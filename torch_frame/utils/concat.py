@@ -1,5 +1,5 @@
 from collections import Counter, defaultdict
-from typing import Dict, List
+from typing import Callable, Dict, List
 
 import torch
 from torch import Tensor
@@ -37,6 +37,32 @@ def cat(tf_list: List[TensorFrame], along: str) -> TensorFrame:
             f"`along` must be either 'row' or 'col' (got {along}).")
 
 
+def _cat_dict_multi_nested_tensor(
+    feat_list: List[Dict[str, MultiNestedTensor]],
+    dim: int,
+) -> Dict[str, MultiNestedTensor]:
+    return {
+        name: MultiNestedTensor.cat([feat[name] for feat in feat_list],
+                                    dim=dim)
+        for name in feat_list[0].keys()
+    }
+
+
+def _get_cat_fn(stype: torch_frame.stype) -> Callable[..., TensorData]:
+    if stype.use_multi_nested_tensor:
+        return MultiNestedTensor.cat
+    elif stype.use_dict_multi_nested_tensor:
+        return _cat_dict_multi_nested_tensor
+    return torch.cat
+
+
+# Concatenation function of each stype, resolved once at import time:
+_cat_fn_dict: Dict[torch_frame.stype, Callable[..., TensorData]] = {
+    stype: _get_cat_fn(stype)
+    for stype in torch_frame.stype
+}
+
+
 def _cat_helper(
     tf_list: List[TensorFrame],
     dim: int,
@@ -49,38 +75,44 @@ def _cat_helper(
         for stype, feat in tf.feat_dict.items():
             feat_list_dict[stype].append(feat)
 
-    feat_dict: Dict[torch_frame.stype, TensorData] = {}
-    for stype, feat_list in feat_list_dict.items():
-        if stype.use_multi_nested_tensor:
-            feat_dict[stype] = MultiNestedTensor.cat(feat_list, dim=dim)
-        elif stype.use_dict_multi_nested_tensor:
-            feat: Dict[str, MultiNestedTensor] = {}
-            for name in feat_list[0].keys():
-                feat[name] = MultiNestedTensor.cat(
-                    [feat[name] for feat in feat_list], dim=dim)
-            feat_dict[stype] = feat
-        else:
-            feat_dict[stype] = torch.cat(feat_list, dim=dim)
+    return {
+        stype: _cat_fn_dict[stype](feat_list, dim=dim)
+        for stype, feat_list in feat_list_dict.items()
+    }
 
-    return feat_dict
+
+def _col_names_dict_equal(
+    col_names_dict: Dict[torch_frame.stype, List[str]],
+    other: Dict[torch_frame.stype, List[str]],
+) -> bool:
+    r"""Returns whether two :obj:`col_names_dict` are equal. Tensor frames
+    sliced from the same tensor frame share their column name lists, so we
+    check for identity first to avoid comparing all column names.
+    """
+    if col_names_dict is other:
+        return True
+    if col_names_dict.keys() != other.keys():
+        return False
+    return all(col_names is other[stype] or col_names == other[stype]
+               for stype, col_names in col_names_dict.items())
 
 
 def _cat_row(tf_list: List[TensorFrame]) -> TensorFrame:
     col_names_dict = tf_list[0].col_names_dict
     for tf in tf_list[1:]:
-        if tf.col_names_dict != col_names_dict:
+        if not _col_names_dict_equal(tf.col_names_dict, col_names_dict):
             raise RuntimeError(
                 f"Cannot perform cat(..., along='row') since col_names_dict's "
                 f"of given tensor frames do not match (expect all "
                 f"{col_names_dict}).")
     if tf_list[0].y is None:
-        if not all([tf.y is None for tf in tf_list]):
+        if not all(tf.y is None for tf in tf_list):
             raise RuntimeError(
                 "Cannot perform cat(..., along='row') since 'y' attribute "
                 "types of given tensor frames do not match (expect all "
                 " `None`).")
     else:
-        if not all([tf.y is not None for tf in tf_list]):
+        if not all(tf.y is not None for tf in tf_list):
             raise RuntimeError(
                 "Cannot perform cat(..., along='row') since 'y' attribute "
                 "types of given tensor frames do not match (expect all "
@@ -94,6 +126,8 @@ def _cat_row(tf_list: List[TensorFrame]) -> TensorFrame:
 
 
 def _get_duplicates(lst: List[str]) -> List[str]:
+    if len(set(lst)) == len(lst):  # Fast path for the common case.
+        return []
     count = Counter(lst)
     return [item for item, count in count.items() if count > 1]
 